@@ -1,20 +1,171 @@
+import asyncio
 import datetime
+import functools
+import hashlib
+import io
+import os
+import queue
 import shutil
 import sqlite3
-import subprocess
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 DB_PATH = DATA_DIR / "app.sqlite"
 UPLOAD_DIR = DATA_DIR / "uploads"
 AUDIO_DIR = DATA_DIR / "audio"
 
+# Connections are opened once at startup and reused across requests.
+# Reads draw from a small pool; all writes go through one dedicated
+# connection serialised by a lock, since SQLite only allows one writer.
+READ_POOL_SIZE = 5
+_read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=READ_POOL_SIZE)
+_write_conn: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+
+# Per-connection settings applied to every pooled connection.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=30000",
+)
+
+# SQL text is kept in module constants so every call passes the identical
+# string and hits the connection's prepared statement cache.
+STATEMENT_CACHE_SIZE = 256
+
+_CREATE_SESSIONS_SQL = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        title TEXT,
+        status TEXT DEFAULT 'created',
+        youtube_url TEXT,
+        media_path TEXT,
+        audio_path TEXT,
+        created_at TEXT,
+        audio_fingerprint TEXT
+    )
+"""
+_CREATE_CHUNKS_SQL = """
+    CREATE TABLE IF NOT EXISTS chunks (
+        id TEXT PRIMARY KEY,
+        session_id TEXT,
+        start_ms INTEGER,
+        end_ms INTEGER,
+        text TEXT,
+        FOREIGN KEY(session_id) REFERENCES sessions(id)
+    )
+"""
+_ADD_AUDIO_FINGERPRINT_SQL = "ALTER TABLE sessions ADD COLUMN audio_fingerprint TEXT"
+# idx_chunks_session_start supersedes the older single-column index.
+_DROP_CHUNKS_INDEX_SQL = "DROP INDEX IF EXISTS idx_chunks_session"
+_CREATE_CHUNKS_START_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_chunks_session_start "
+    "ON chunks(session_id, start_ms)"
+)
+_CREATE_SESSIONS_CREATED_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at DESC)"
+)
+
+_SESSION_COLUMNS = (
+    "id",
+    "title",
+    "status",
+    "youtube_url",
+    "media_path",
+    "audio_path",
+    "created_at",
+)
+# Internal columns are appended after the public ones and never sent to
+# clients; only the lookup used by the write endpoints selects them.
+_SESSION_RECORD_COLUMNS = _SESSION_COLUMNS + ("audio_fingerprint",)
+_SELECT_SESSION_SQL = f"SELECT {', '.join(_SESSION_COLUMNS)} FROM sessions WHERE id = ?"
+_SELECT_SESSION_RECORD_SQL = (
+    f"SELECT {', '.join(_SESSION_RECORD_COLUMNS)} FROM sessions WHERE id = ?"
+)
+_SESSION_EXISTS_SQL = "SELECT 1 FROM sessions WHERE id = ?"
+# Column order matches the positional row factories below.
+_SELECT_CHUNKS_SQL = (
+    "SELECT id, session_id, start_ms, end_ms, text FROM chunks "
+    "WHERE session_id = ? ORDER BY start_ms"
+)
+_LIST_SESSIONS_SQL = (
+    "SELECT id, title, status, youtube_url, media_path, audio_path, created_at "
+    "FROM sessions ORDER BY created_at DESC"
+)
+_INSERT_SESSION_SQL = (
+    "INSERT INTO sessions(id, title, status, youtube_url, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_UPDATE_SESSION_MEDIA_SQL = (
+    "UPDATE sessions SET status = 'uploaded', media_path = ?, audio_path = NULL "
+    "WHERE id = ?"
+)
+_UPDATE_SESSION_READY_SQL = (
+    "UPDATE sessions SET status = 'ready', audio_path = ?, audio_fingerprint = ? "
+    "WHERE id = ?"
+)
+_DELETE_CHUNKS_SQL = "DELETE FROM chunks WHERE session_id = ?"
+_INSERT_CHUNK_SQL = (
+    "INSERT INTO chunks(id, session_id, start_ms, end_ms, text) VALUES (?, ?, ?, ?, ?)"
+)
+
+# Short-lived cache of read results, keyed by (table, query, args) and
+# dropped per table whenever that table is written to.
+QUERY_CACHE_TTL = 5.0
+_QCACHE: Dict[Tuple, Tuple[float, Any]] = {}
+_QCACHE_GENERATION: Dict[str, int] = {}
+_QCACHE_LOCK = threading.Lock()
+
+# Bytes hashed from each end of a media file to fingerprint its contents.
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+
+# Threads each ffmpeg run may use, so it doesn't compete with the API workers.
+FFMPEG_THREADS = 2
+# Cap concurrent ffmpeg runs so their threads together fit the CPU count.
+FFMPEG_CONCURRENCY = max(1, (os.cpu_count() or 1) // FFMPEG_THREADS)
+_ffmpeg_semaphore = asyncio.Semaphore(FFMPEG_CONCURRENCY)
+# Only the tail of ffmpeg's stderr is kept for error messages.
+FFMPEG_STDERR_LIMIT = 64 * 1024
+
+# Session ids are handed out from a buffer refilled this many at a time.
+UUID_BATCH_SIZE = 64
+_uuid_pool: List[str] = []
+_uuid_lock = threading.Lock()
+# A forked worker must not hand out the parent's ids.
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+# Upload directories already known to exist, so each is created once per
+# process rather than on every upload.
+_session_dirs: Set[str] = set()
+_session_dirs_lock = threading.Lock()
+
+# Buffer size for the userspace copy used when uploads can't be copied
+# inside the kernel.
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 def init_storage() -> None:
     """Create folders and tables needed for local persistence."""
@@ -22,40 +173,133 @@ def init_storage() -> None:
         path.mkdir(parents=True, exist_ok=True)
 
     with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sessions (
-                id TEXT PRIMARY KEY,
-                title TEXT,
-                status TEXT DEFAULT 'created',
-                youtube_url TEXT,
-                media_path TEXT,
-                audio_path TEXT,
-                created_at TEXT
-            )
-        """
-        )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS chunks (
-                id TEXT PRIMARY KEY,
-                session_id TEXT,
-                start_ms INTEGER,
-                end_ms INTEGER,
-                text TEXT,
-                FOREIGN KEY(session_id) REFERENCES sessions(id)
-            )
-        """
-        )
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_chunks_session ON chunks(session_id)
-        """
-        )
+        # WAL is persisted in the database file, so this only needs to run once.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_CREATE_SESSIONS_SQL)
+        # Databases created before audio_fingerprint existed need the column.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+        if "audio_fingerprint" not in columns:
+            conn.execute(_ADD_AUDIO_FINGERPRINT_SQL)
+        conn.execute(_CREATE_CHUNKS_SQL)
+        conn.execute(_CREATE_CHUNKS_START_INDEX_SQL)
+        conn.execute(_DROP_CHUNKS_INDEX_SQL)
+        conn.execute(_CREATE_SESSIONS_CREATED_INDEX_SQL)
+
+
+def open_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def init_pool() -> None:
+    """Open the shared writer connection and fill the reader pool."""
+    global _write_conn
+    _write_conn = open_connection()
+    for _ in range(READ_POOL_SIZE):
+        _read_pool.put(open_connection())
+
+
+def close_pool() -> None:
+    global _write_conn
+    while not _read_pool.empty():
+        _read_pool.get_nowait().close()
+    if _write_conn is not None:
+        _write_conn.close()
+        _write_conn = None
+
+
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    """Borrow a read connection from the pool for the duration of the block."""
+    conn = _read_pool.get()
+    try:
+        yield conn
+    finally:
+        _read_pool.put(conn)
+
+
+@contextmanager
+def get_write_conn() -> Iterator[sqlite3.Connection]:
+    """Run the block in a transaction on the single writer connection."""
+    with _write_lock:
+        conn = _write_conn
+        # Take the write lock up front so other processes sharing the
+        # database can't force a SQLITE_BUSY upgrade mid-transaction.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT can leave the transaction open; roll it back so
+            # the shared connection stays usable. SQLite may have already
+            # rolled back on its own for some errors.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+
+def cached(ttl: float = QUERY_CACHE_TTL, table: str = "sessions") -> Callable:
+    """Cache a read helper's result for ttl seconds, invalidated by table."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = (table, func.__qualname__, args)
+            now = time.monotonic()
+            with _QCACHE_LOCK:
+                hit = _QCACHE.get(key)
+                if hit and hit[0] > now:
+                    return hit[1]
+                generation = _QCACHE_GENERATION.get(table, 0)
+            value = func(*args)
+            with _QCACHE_LOCK:
+                # Skip storing if a write invalidated the table mid-query.
+                if _QCACHE_GENERATION.get(table, 0) == generation:
+                    _QCACHE[key] = (now + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate(table: str) -> None:
+    with _QCACHE_LOCK:
+        _QCACHE_GENERATION[table] = _QCACHE_GENERATION.get(table, 0) + 1
+        for key in [k for k in _QCACHE if k[0] == table]:
+            del _QCACHE[key]
+
+
+def batch_uuids(n: int) -> List[str]:
+    """Generate n random UUID4 strings from a single os.urandom call."""
+    buf = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=buf[i : i + 16], version=4)) for i in range(0, 16 * n, 16)
+    ]
 
 
-def row_to_dict(row: sqlite3.Row) -> Dict:
-    return {k: row[k] for k in row.keys()}
+def new_uuid() -> str:
+    with _uuid_lock:
+        if not _uuid_pool:
+            _uuid_pool.extend(batch_uuids(UUID_BATCH_SIZE))
+        return _uuid_pool.pop()
+
+
+def ensure_session_dir(session_id: str) -> Path:
+    """Return the session's upload directory, creating it on first use."""
+    path = UPLOAD_DIR / session_id
+    with _session_dirs_lock:
+        if session_id not in _session_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _session_dirs.add(session_id)
+    return path
 
 
 class SessionCreateRequest(BaseModel):
@@ -79,7 +323,46 @@ class ChunkResponse(BaseModel):
     end_ms: int
     text: str
 
-app = FastAPI(title="RECALL.GG", description="Esports comms search MVP")
+
+# Row factories that build results straight from result tuples.
+# model_construct skips validation; the column types come from our schema.
+def session_dict_from_row(cursor: sqlite3.Cursor, row: Tuple) -> Dict:
+    # zip stops at the row's length, so this serves both session SELECTs.
+    return dict(zip(_SESSION_RECORD_COLUMNS, row))
+
+
+def session_from_row(cursor: sqlite3.Cursor, row: Tuple) -> SessionResponse:
+    return SessionResponse.model_construct(
+        id=row[0],
+        title=row[1],
+        status=row[2],
+        youtube_url=row[3],
+        media_path=row[4],
+        audio_path=row[5],
+        created_at=row[6],
+    )
+
+
+def chunk_from_row(cursor: Optional[sqlite3.Cursor], row: Tuple) -> ChunkResponse:
+    return ChunkResponse.model_construct(
+        id=row[0], session_id=row[1], start_ms=row[2], end_ms=row[3], text=row[4]
+    )
+
+
+def query(
+    conn: sqlite3.Connection, sql: str, params: Tuple, row_factory: Callable
+) -> sqlite3.Cursor:
+    """Execute sql on a fresh cursor that uses row_factory instead of Row."""
+    cursor = conn.cursor()
+    cursor.row_factory = row_factory
+    return cursor.execute(sql, params)
+
+
+app = FastAPI(
+    title="RECALL.GG",
+    description="Esports comms search MVP",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -93,6 +376,12 @@ app.add_middleware(
 @app.on_event("startup")
 def startup() -> None:
     init_storage()
+    init_pool()
+
+
+@app.on_event("shutdown")
+def shutdown() -> None:
+    close_pool()
 
 
 @app.get("/health")
@@ -100,39 +389,70 @@ def health() -> Dict[str, bool]:
     return {"ok": True}
 
 
+# Not cached: upload_media and process_media act on this row, and another
+# worker's write wouldn't invalidate this process's cache.
 def fetch_session(session_id: str) -> Dict:
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        row = conn.execute(
-            "SELECT * FROM sessions WHERE id = ?", (session_id,)
+    """Fetch a session including internal columns such as audio_fingerprint."""
+    with get_conn() as conn:
+        session = query(
+            conn, _SELECT_SESSION_RECORD_SQL, (session_id,), session_dict_from_row
         ).fetchone()
-    if not row:
+    if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    return row_to_dict(row)
+    return session
+
+
+def fetch_session_and_chunks(
+    session_id: str,
+) -> Tuple[Dict, List[ChunkResponse]]:
+    """Read a session and its chunks in one read transaction."""
+    with get_conn() as conn:
+        conn.execute("BEGIN")
+        try:
+            session = query(
+                conn, _SELECT_SESSION_SQL, (session_id,), session_dict_from_row
+            ).fetchone()
+            chunks = (
+                query(
+                    conn, _SELECT_CHUNKS_SQL, (session_id,), chunk_from_row
+                ).fetchall()
+                if session
+                else []
+            )
+        finally:
+            conn.execute("COMMIT")
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session, chunks
 
 
-def fetch_chunks(session_id: str) -> List[Dict]:
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM chunks WHERE session_id = ? ORDER BY start_ms",
-            (session_id,),
+def fetch_existing_chunks(session_id: str) -> List[ChunkResponse]:
+    """Fetch chunks, raising 404 if the session itself does not exist."""
+    with get_conn() as conn:
+        chunks = query(
+            conn, _SELECT_CHUNKS_SQL, (session_id,), chunk_from_row
         ).fetchall()
-    return [row_to_dict(row) for row in rows]
+        # Only an empty result needs the extra existence check.
+        exists = bool(chunks) or (
+            conn.execute(_SESSION_EXISTS_SQL, (session_id,)).fetchone() is not None
+        )
+    if not exists:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return chunks
 
 
 @app.post("/sessions", response_model=SessionResponse)
 def create_session(payload: SessionCreateRequest) -> SessionResponse:
-    session_id = str(uuid.uuid4())
-    created_at = datetime.datetime.utcnow().isoformat() + "Z"
-    with sqlite3.connect(DB_PATH) as conn:
+    session_id = new_uuid()
+    # Fixed-width ISO-8601 so created_at sorts chronologically as text.
+    created_at = datetime.datetime.utcnow().isoformat(timespec="microseconds") + "Z"
+    with get_write_conn() as conn:
         conn.execute(
-            """
-            INSERT INTO sessions(id, title, youtube_url, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (session_id, payload.title, payload.youtube_url, created_at),
+            _INSERT_SESSION_SQL,
+            (session_id, payload.title, "created", payload.youtube_url, created_at),
         )
+    _invalidate("sessions")
+    ensure_session_dir(session_id)
     return SessionResponse(
         id=session_id,
         title=payload.title,
@@ -145,44 +465,97 @@ def create_session(payload: SessionCreateRequest) -> SessionResponse:
 
 
 @app.get("/sessions", response_model=List[SessionResponse])
+@cached(table="sessions")
 def list_sessions() -> List[SessionResponse]:
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM sessions ORDER BY datetime(created_at) DESC"
-        ).fetchall()
-    return [SessionResponse(**row_to_dict(row)) for row in rows]
+    with get_conn() as conn:
+        return query(conn, _LIST_SESSIONS_SQL, (), session_from_row).fetchall()
 
 
 @app.get("/sessions/{session_id}")
 def get_session(session_id: str) -> Dict:
-    session = fetch_session(session_id)
-    chunks = fetch_chunks(session_id)
+    session, chunks = fetch_session_and_chunks(session_id)
     return {"session": session, "chunks": chunks}
 
 @app.get("/sessions/{session_id}/chunks", response_model=List[ChunkResponse])
 def get_chunks(session_id: str) -> List[ChunkResponse]:
-    fetch_session(session_id)
-    return [ChunkResponse(**c) for c in fetch_chunks(session_id)]
+    return fetch_existing_chunks(session_id)
+
+def _kernel_copy(src_fd: int, dst_fd: int, offset: int) -> bool:
+    """Copy src_fd from offset to dst_fd without a userspace buffer.
+
+    Tries copy_file_range (which can reflink or copy server-side) and then
+    sendfile. Returns False if neither is supported for these descriptors.
+    """
+    end = os.fstat(src_fd).st_size
+    methods: List[Callable[[int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(
+            lambda pos, count: os.copy_file_range(src_fd, dst_fd, count, pos)
+        )
+    if hasattr(os, "sendfile"):
+        methods.append(
+            lambda pos, count: os.sendfile(dst_fd, src_fd, pos, count)
+        )
+
+    for copy in methods:
+        pos = offset
+        try:
+            while pos < end:
+                sent = copy(pos, end - pos)
+                if sent == 0:
+                    # Some filesystems report "unsupported" as a zero-byte
+                    # copy rather than an error.
+                    raise OSError(f"short copy at byte {pos} of {end}")
+                pos += sent
+        except OSError:
+            # Unsupported for this pair of files; only safe to fall back if
+            # nothing has been written yet.
+            if pos == offset:
+                continue
+            raise
+        return True
+    return False
+
+
+def copy_upload(
+    src: BinaryIO, dst: BinaryIO, buffer_size: int = COPY_BUFFER_SIZE
+) -> None:
+    """Copy an uploaded file into dst, zero-copy when it is already on disk."""
+    # Calling fileno() on a SpooledTemporaryFile forces it to disk, so only
+    # take the kernel path once it has rolled over on its own.
+    if getattr(src, "_rolled", True):
+        try:
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+        else:
+            if _kernel_copy(src_fd, dst_fd, src.tell()):
+                return
+    shutil.copyfileobj(src, dst, buffer_size)
+
+
+def store_media(session_id: str, src: BinaryIO, dest_path: Path) -> None:
+    """Write an upload to dest_path and record it on the session."""
+    ensure_session_dir(session_id)
+    with dest_path.open("wb") as buffer:
+        copy_upload(src, buffer)
+
+    with get_write_conn() as conn:
+        conn.execute(_UPDATE_SESSION_MEDIA_SQL, (str(dest_path), session_id))
+    _invalidate("sessions")
+
 
 @app.post("/sessions/{session_id}/media")
 async def upload_media(session_id: str, file: UploadFile = File(...)) -> Dict:
-    session = fetch_session(session_id)
+    session = await run_in_threadpool(fetch_session, session_id)
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
-    dest_dir = UPLOAD_DIR / session_id
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    dest_path = dest_dir / Path(file.filename).name
+    dest_path = UPLOAD_DIR / session_id / Path(file.filename).name
 
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            "UPDATE sessions SET status = 'uploaded', media_path = ?, audio_path = NULL WHERE id = ?",
-            (str(dest_path), session_id),
-        )
+    # The copy and database write block, so keep them off the event loop.
+    await run_in_threadpool(store_media, session_id, file.file, dest_path)
 
     return {
         "session": session_id,
@@ -191,7 +564,29 @@ async def upload_media(session_id: str, file: UploadFile = File(...)) -> Dict:
     }
 
 
-def extract_audio(session_id: str, media_path: Path) -> Path:
+def media_fingerprint(path: Path) -> str:
+    """Cheap content fingerprint from the file size and its first/last blocks."""
+    size = path.stat().st_size
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with path.open("rb") as f:
+        digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+        if size > FINGERPRINT_BLOCK_SIZE:
+            f.seek(max(size - FINGERPRINT_BLOCK_SIZE, FINGERPRINT_BLOCK_SIZE))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+async def read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Drain stream to EOF, keeping at most the last limit bytes."""
+    tail = b""
+    while chunk := await stream.read(limit):
+        tail = (tail + chunk)[-limit:]
+    return tail
+
+
+async def extract_audio(
+    session_id: str, media_path: Path, same_media: bool = False
+) -> Path:
     audio_path = AUDIO_DIR / f"{session_id}.wav"
     audio_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -199,40 +594,94 @@ def extract_audio(session_id: str, media_path: Path) -> Path:
     if media_path.suffix.lower() in {".wav", ".mp3", ".m4a", ".ogg", ".flac"}:
         return media_path
 
-    try:
-        subprocess.run(
-            [
+    # Reuse an earlier extraction if it is newer than the media, or if it was
+    # produced from media with the same fingerprint (e.g. a re-upload).
+    if audio_path.exists() and (
+        same_media or audio_path.stat().st_mtime >= media_path.stat().st_mtime
+    ):
+        return audio_path
+
+    # ffmpeg writes to a unique temp sibling that only replaces audio_path
+    # once it has finished, so the reuse check never sees a partial file.
+    tmp_path = audio_path.with_name(f"{audio_path.name}.{new_uuid()}.part")
+    async with _ffmpeg_semaphore:
+        try:
+            proc = await asyncio.create_subprocess_exec(
                 "ffmpeg",
+                "-nostdin",
+                "-nostats",
+                "-loglevel",
+                "error",
                 "-y",
+                "-threads",
+                str(FFMPEG_THREADS),
+                "-filter_threads",
+                str(FFMPEG_THREADS),
                 "-i",
                 str(media_path),
+                "-map",
+                "0:a:0",
                 "-vn",
+                "-ac",
+                "1",
                 "-acodec",
                 "pcm_s16le",
                 "-ar",
                 "16000",
-                str(audio_path),
-            ],
-            capture_output=True,
-            check=True,
-        )
-    except FileNotFoundError as exc:
-        raise HTTPException(
-            status_code=500,
-            detail="ffmpeg is required to extract audio from video files.",
-        ) from exc
-    except subprocess.CalledProcessError as exc:
+                "-f",
+                "wav",
+                str(tmp_path),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise HTTPException(
+                status_code=500,
+                detail="ffmpeg is required to extract audio from video files.",
+            ) from exc
+        try:
+            stderr = await read_tail(proc.stderr, FFMPEG_STDERR_LIMIT)
+            await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    if proc.returncode != 0:
+        tmp_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Audio extraction failed: {exc.stderr.decode(errors='ignore')}",
-        ) from exc
+            detail=f"Audio extraction failed: {stderr.decode(errors='ignore')}",
+        )
+    os.replace(tmp_path, audio_path)
 
     return audio_path
 
 
+def save_chunks(
+    session_id: str, audio_path: Path, fingerprint: str, chunks: List[Tuple]
+) -> List[ChunkResponse]:
+    """Replace a session's chunks, mark it ready and return them as models."""
+    with get_write_conn() as conn:
+        conn.execute(_DELETE_CHUNKS_SQL, (session_id,))
+        conn.executemany(_INSERT_CHUNK_SQL, chunks)
+        conn.execute(
+            _UPDATE_SESSION_READY_SQL, (str(audio_path), fingerprint, session_id)
+        )
+    _invalidate("sessions")
+    _invalidate("chunks")
+    # The inserted tuples are in the chunks column order, so build the
+    # response from them instead of reading the rows back.
+    return [chunk_from_row(None, chunk) for chunk in chunks]
+
+
 @app.post("/sessions/{session_id}/process")
-def process_media(session_id: str) -> Dict:
-    session = fetch_session(session_id)
+async def process_media(session_id: str) -> Dict:
+    # Database and file reads run in the threadpool so the event loop stays
+    # free while ffmpeg is running.
+    session = await run_in_threadpool(fetch_session, session_id)
     media_path = session.get("media_path")
     if not media_path:
         raise HTTPException(
@@ -243,25 +692,31 @@ def process_media(session_id: str) -> Dict:
     if not media_file.exists():
         raise HTTPException(status_code=400, detail="Stored media file is missing.")
 
-    audio_path = extract_audio(session_id, media_file)
+    fingerprint = await run_in_threadpool(media_fingerprint, media_file)
+    audio_path = await extract_audio(
+        session_id,
+        media_file,
+        same_media=fingerprint == session.get("audio_fingerprint"),
+    )
 
+    chunk_ids = batch_uuids(3)
     dummy_chunks = [
         (
-            str(uuid.uuid4()),
+            chunk_ids[0],
             session_id,
             0,
             15000,
             "Intro and setup for the round.",
         ),
         (
-            str(uuid.uuid4()),
+            chunk_ids[1],
             session_id,
             15000,
             30000,
             "Key play-by-play comms.",
         ),
         (
-            str(uuid.uuid4()),
+            chunk_ids[2],
             session_id,
             30000,
             45000,
@@ -269,22 +724,12 @@ def process_media(session_id: str) -> Dict:
         ),
     ]
 
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute("DELETE FROM chunks WHERE session_id = ?", (session_id,))
-        conn.executemany(
-            """
-            INSERT INTO chunks(id, session_id, start_ms, end_ms, text)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            dummy_chunks,
-        )
-        conn.execute(
-            "UPDATE sessions SET status = 'ready', audio_path = ? WHERE id = ?",
-            (str(audio_path), session_id),
-        )
+    chunks = await run_in_threadpool(
+        save_chunks, session_id, audio_path, fingerprint, dummy_chunks
+    )
 
     return {
         "session": session_id,
         "audio_path": str(audio_path),
-        "chunks": fetch_chunks(session_id),
+        "chunks": chunks,
     }